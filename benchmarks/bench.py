@@ -0,0 +1,317 @@
+# coding: utf-8
+"""Headless benchmarks of tkyml
+
+Time yaml loading, tree building, variant switching, image resizing,
+rebuilding on synthetic templates and UI latency under concurrent coroutines,
+then compare with a stored baseline.
+
+[USAGE]
+
+    xvfb-run -a python benchmarks/bench.py --save baseline.json
+    xvfb-run -a python benchmarks/bench.py --baseline baseline.json
+
+Each case runs in its own process. Results are written as json (wall time
+in ms, Tcl calls, mean and max UI lag in ms, peak RSS in KiB per case), exit
+code is 1 if some result regressed past the tolerance.
+"""
+
+# For arguments and output
+from argparse import ArgumentParser
+from typing import Callable
+import subprocess
+import json
+import sys
+import os
+
+# For measures
+from time import perf_counter
+import resource
+import asyncio
+
+# For the app
+from tempfile import NamedTemporaryFile
+from PIL import Image
+import yaml
+import tkyml
+
+
+SIZES = (10, 100, 1000, 10000)
+DEPTH = 64  # Depth of chains in deep trees
+VARIANTS = 16
+SWITCHES = 16
+ENTRIES = (1000, 5000)
+BURST = 200  # <Configure> events per burst
+FRAMES = 8  # Frames of the gif
+TASKS = (10, 100, 1000)  # Concurrent coroutines
+WORK = 1000  # Loop of a coroutine's step
+DURATION = 1000  # Time in ms under load
+PROBE = 5  # Interval in ms of latency measures
+
+
+class Counter:
+
+    """Count Tcl calls of an interpreter.
+    """
+
+    calls = 0
+
+    def __init__(self, tk: any) -> None:
+        self.__tk = tk
+
+    def __getattr__(self, name: str) -> any:
+        return getattr(self.__tk, name)
+
+    def call(self, *args: any) -> any:
+        self.calls += 1
+        return self.__tk.call(*args)
+
+    def eval(self, script: str) -> str:
+        self.calls += 1
+        return self.__tk.eval(script)
+
+
+def wide(n: int) -> dict[str, any]:
+    """Template of n labels in a single frame, with variants on all of them."""
+    children = {f"w{i}": {":type": "Label", ":text": str(i), ":pack": None} for i in range(n)}
+    template = {"root": {":type": "Frame", ":pack": None, **children}}
+    for v in range(VARIANTS):
+        color = f"#{v * 15:02x}{v * 15:02x}{v * 15:02x}"
+        template[f".v{v}"] = {"root": {f"w{i}": {":bg": color} for i in range(n)}}
+    return template
+
+
+def deep(n: int) -> dict[str, any]:
+    """Template of n frames, nested in chains of DEPTH."""
+    template = {}
+    for c in range(0, n, DEPTH):
+        node = template
+        for d in range(c, min(c + DEPTH, n)):
+            child = node[f"d{d}"] = {":type": "Frame", ":pack": None}
+            node = child
+    return template
+
+
+def menus(n: int) -> dict[str, any]:
+    """Template of an option menu and a lazy menu of n entries each."""
+    return {
+        "menu": {
+            ":type": "Menu",
+            "items": {
+                ":type": "Menu",
+                ":label": "Items",
+                ":button": {"labels": [f"item {i}" for i in range(n)], "lazy": True},
+            },
+        },
+        "options": {
+            ":type": "OptionMenu",
+            ":default": {"label": "item 0", "value": 0},
+            ":select": {f"item {i}": i for i in range(n)},
+            ":pack": None,
+        },
+    }
+
+
+class Bench:
+
+    """Run the benchmarks on a single app.
+    """
+
+    def __init__(self) -> None:
+        with NamedTemporaryFile("w", suffix=".yml", delete=False) as file:
+            file.write("{}")
+        try:
+            self.app = tkyml.App(file.name)
+        finally:
+            os.remove(file.name)
+        self.counter = self.app.tk = Counter(self.app.tk)
+        self.results: dict[str, dict[str, float]] = {}
+
+    def measure(self, key: str, fn: Callable, repeat: int = 1) -> any:
+        """Time a function and count its Tcl calls.
+
+        Args:
+            key (str): Result's name.
+            fn (Callable): Function to measure.
+            repeat (int, optional): Times to call the function. Defaults to 1.
+
+        Returns:
+            any: Last result of the function.
+        """
+        calls = self.counter.calls
+        start = perf_counter()
+        for _ in range(repeat):
+            result = fn()
+        wall = (perf_counter() - start) * 1000
+        self.results[key] = {
+            "wall_ms": round(wall, 3),
+            "tcl_calls": self.counter.calls - calls,
+        }
+        return result
+
+    def tree(self, shape: str, n: int, template: dict[str, any]):
+        text = yaml.safe_dump(template)
+        load = lambda: yaml.load(text, Loader=yaml.SafeLoader)
+        self.measure(f"load.{shape}.{n}", load)
+        values = load()
+        self.measure(f"build.{shape}.{n}", lambda: self.app._set(values))
+        self.app.update()
+        if shape == "wide":
+            variants = iter(range(SWITCHES))
+            self.measure(f"variant.{shape}.{n}", lambda: self.app.variant(
+                f"v{next(variants) % VARIANTS}"), SWITCHES)
+        values = load()
+        self.measure(f"rebuild.{shape}.{n}", lambda: (self.app.empty(), self.app._set(values)))
+        self.app.empty()
+
+    def menus(self, n: int):
+        self.measure(f"build.menus.{n}", lambda: self.app._set(menus(n)))
+        for name in ("options", "menu.items"):
+            widget = self.app.nametowidget(name)
+            post = widget._menu.cget("postcommand")
+            self.measure(f"post.{name}.{n}", lambda: (widget.refresh(), self.app.tk.eval(post)))
+        self.app.config(menu="")
+        self.app.empty()
+
+    def burst(self, widget: tkyml.tk.Widget, key: str):
+        def configure():
+            for i in range(BURST):
+                widget.event_generate("<Configure>", width=100 + i % 300, height=100 + i % 200)
+            self.app.update()
+        self.measure(key, configure)
+
+    def images(self):
+        self.app._set({
+            "img": {":type": "Img", ":mode": "contain", ":pack": {"fill": "both", "expand": True}},
+            "gif": {":type": "Gif", ":delay": 50},
+        })
+        img = self.app.nametowidget("img")
+        img.data(Image.new("RGB", (1024, 768), "red"))
+        self.burst(img, "resize.img")
+        gif = self.app.nametowidget("gif")
+        gif.data(Image.new("RGB", (512, 384), "blue") for _ in range(FRAMES))
+        gif.bind("<Configure>", gif._resize_contain)
+        self.burst(gif, "resize.gif")
+        self.app.empty()
+
+    def tasks(self, n: int):
+        model = tkyml.Model(count=0)
+        self.app.model("load", model)
+        self.app._set({"status": {":type": "Label", ":link": {"text": "load.count"}, ":pack": None}})
+
+        async def step(i: int):
+            while True:
+                sum(range(WORK))
+                model.count = i
+                await asyncio.sleep(0)
+
+        def start():
+            for i in range(n):
+                self.app.spawn(step(i))
+            self.app.after(DURATION, self.app.quit)
+
+        self.app.after_idle(start)
+        key = f"async.{n}"
+        self.measure(key, lambda: self.app.run_async(probe=PROBE))
+        samples, mean, peak = self.app.latency()
+        self.results[key].update(lag_samples=samples, lag_mean_ms=round(mean, 3), lag_max_ms=round(peak, 3))
+        self.app.empty()
+
+    def run(self, case: str) -> dict[str, dict[str, float]]:
+        """Run a benchmark case, with the process' peak RSS.
+
+        Args:
+            case (str): Case's name (see cases).
+
+        Returns:
+            dict[str, dict[str, float]]: Results by name.
+        """
+        kind, _, n = case.partition(".")
+        if kind in ("wide", "deep"):
+            self.tree(kind, int(n), globals()[kind](int(n)))
+        elif kind == "menus":
+            self.menus(int(n))
+        elif kind == "async":
+            self.tasks(int(n))
+        else:
+            self.images()
+        self.results[case] = {"peak_rss_kib": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss}
+        return self.results
+
+
+def cases(sizes: tuple[int], entries: tuple[int], tasks: tuple[int]) -> list[str]:
+    """List names of the benchmark cases."""
+    return [
+        *(f"{shape}.{n}" for n in sizes for shape in ("wide", "deep")),
+        *(f"menus.{n}" for n in entries),
+        "images",
+        *(f"async.{n}" for n in tasks),
+    ]
+
+
+def run(case: str) -> dict[str, dict[str, float]]:
+    """Run a benchmark case in a new process, so its peak RSS is its own.
+
+    Args:
+        case (str): Case's name.
+
+    Returns:
+        dict[str, dict[str, float]]: Results by name.
+    """
+    process = subprocess.run([sys.executable, __file__, "--case", case], capture_output=True, text=True, check=True)
+    return json.loads(process.stdout)
+
+
+def compare(results: dict[str, dict[str, float]], baseline: dict[str, dict[str, float]], tolerance: float) -> list[str]:
+    """Find results slower, lagging, heavier or making more Tcl calls than the baseline.
+
+    Args:
+        results (dict[str, dict[str, float]]): Current results.
+        baseline (dict[str, dict[str, float]]): Stored results.
+        tolerance (float): Allowed ratio of wall time increase.
+
+    Returns:
+        list[str]: Description of the regressions.
+    """
+    regressions = []
+    for key, result in results.items():
+        base = baseline.get(key)
+        if base is None:
+            continue
+        for metric, unit in (("wall_ms", "ms"), ("lag_max_ms", "ms max lag"), ("peak_rss_kib", "KiB peak RSS")):
+            if metric in base and result.get(metric, 0) > base[metric] * (1 + tolerance):
+                regressions.append(f"{key}: {base[metric]}{unit} -> {result[metric]}{unit}")
+        if "tcl_calls" in base and result.get("tcl_calls", 0) > base["tcl_calls"]:
+            regressions.append(f"{key}: {base['tcl_calls']} -> {result['tcl_calls']} Tcl calls")
+    return regressions
+
+
+def main() -> int:
+    parser = ArgumentParser(description="Headless benchmarks of tkyml.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES, help="Widgets per template.")
+    parser.add_argument("--entries", type=int, nargs="+", default=ENTRIES, help="Entries per menu.")
+    parser.add_argument("--tasks", type=int, nargs="+", default=TASKS, help="Concurrent coroutines.")
+    parser.add_argument("--save", help="Write results to this json file.")
+    parser.add_argument("--baseline", help="Compare with this json file.")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed ratio of slow down.")
+    parser.add_argument("--case", help="Only run this case, in this process.")
+    args = parser.parse_args()
+
+    if args.case:
+        json.dump(Bench().run(args.case), sys.stdout)
+        return 0
+    results = {}
+    for case in cases(args.sizes, args.entries, args.tasks):
+        results.update(run(case))
+    report = {"version": tkyml.__version__, "results": results}
+    if args.baseline:
+        with open(args.baseline, 'r') as file:
+            report["regressions"] = compare(results, json.load(file)["results"], args.tolerance)
+    if args.save:
+        with open(args.save, 'w') as file:
+            json.dump(report, file, indent=2)
+    json.dump(report, sys.stdout, indent=2)
+    return 1 if report.get("regressions") else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -25,6 +25,8 @@ properties and widgets with this syntax:
                         or cst.<widget_class_name> 
 
         ::     ...  ->  Declare a list of methods/attributes, so you can use the same two time in a row.
+
+        :link: {...} -> Link options to attributes of models (see App.model), like { text: <model>.<attribute> }.
 """
 
 # Typing
@@ -35,13 +37,17 @@ from typing import Callable
 from multiprocessing import Process
 import yaml
 
-# To load custom fonts
-from tkextrafont import Font
-from pathlib import Path
+# To run along asyncio
+from threading import Thread
+from time import monotonic
+import asyncio
 
 
 # Widgets
-from .widgets import tk, _BaseWidget, WIDGETS, _C
+from .widgets import tk, _BaseWidget, _Binder, _Fonts, _Pool, _Scheduler, Model, WIDGETS, _C
+
+# Opt-in build profiler (see TKYML_PROFILE)
+from . import profiler
 
 
 __author__ = "Lucas Maillet"
@@ -86,8 +92,13 @@ class App(tk.Tk, _BaseWidget):
     Allow the creation of an app from a yaml file.
     """
 
+    _loop: asyncio.AbstractEventLoop = None  # Running asyncio loop
+    __lags = (0, 0., 0.)  # UI latency samples, total and max
+    __probing: str | None = None  # Timer of the latency probe
+
     def __init__(self, file: str, *args: any, **kwargs: dict[str, any]):
         super().__init__(*args, **kwargs)
+        _Pool.of(self)  # Created in the app's thread
         with open(file, 'r') as file:
             self._set(yaml.load(file, Loader=yaml.SafeLoader))
 
@@ -110,17 +121,150 @@ class App(tk.Tk, _BaseWidget):
             Callable: Sub wrapper function.
         """
         def wrapper(fn: Callable) -> Callable:
-            self.protocol(name, fn)
+            self.protocol(name, self._command(fn))
             return fn
         return wrapper
 
+    def __probe(self, interval: int, due: float):
+        lag = max(0., monotonic() - due) * 1000
+        self.__lags = (self.__lags[0] + 1, self.__lags[1] + lag, max(self.__lags[2], lag))
+        self.__probing = self.after(interval, self.__probe, interval, monotonic() + interval / 1000)
+
+    async def __shutdown(self):
+        tasks = tuple(task for task in asyncio.all_tasks() if task is not asyncio.current_task())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        asyncio.get_running_loop().stop()
+
+    def run_async(self, loop: asyncio.AbstractEventLoop = None, probe: int = 0):
+        """Run the app along an asyncio event loop.
+
+        The asyncio loop runs in its own thread, so both loops block on their
+        own events. Coroutines functions binded with event, proto or
+        Menu.entry are run in it (see spawn). From them, changes of models,
+        spawn, submit and then are handed off to the app's thread, plain
+        tkinter calls are marshalled by Tcl, any other call (_set, variant,
+        event, link...) must go through post.
+
+        Args:
+            loop (asyncio.AbstractEventLoop, optional): Loop to use. Defaults to a new one.
+            probe (int, optional): Interval in ms of UI latency measures (see latency), 0 to disable. Defaults to 0.
+        """
+        loop = self._loop = loop or asyncio.new_event_loop()
+        thread = Thread(target=loop.run_forever, daemon=True)
+        thread.start()
+        if probe:
+            self.__lags = (0, 0., 0.)
+            self.__probing = self.after(probe, self.__probe, probe, monotonic() + probe / 1000)
+        try:
+            self.mainloop()
+        finally:
+            self._loop = None
+            if self.__probing:
+                try:
+                    self.after_cancel(self.__probing)
+                except tk.TclError:
+                    pass  # App is destroyed
+                self.__probing = None
+            asyncio.run_coroutine_threadsafe(self.__shutdown(), loop)
+            thread.join()
+            loop.close()
+
+    def post(self, fn: Callable, *args: any):
+        """Call a function in the app's thread, from any thread (e.g. coroutines of run_async).
+
+        Args:
+            fn (Callable): Some function.
+        """
+        _Pool.of(self).post(fn, *args)
+
+    def model(self, name: str, model: Model):
+        """Add a model, that widgets can link to (see :link:).
+
+        Args:
+            name (str): Model's name in links paths.
+            model (Model): The model.
+        """
+        _Binder.of(self).register(name, model)
+
+    def mainloop(self, n: int = 0):
+        """Run the app's event loop, delivering results of works done before.
+
+        Args:
+            n (int, optional): Minimal number of windows to keep running. Defaults to 0.
+        """
+        self.after_idle(_Pool.of(self).flush)
+        super().mainloop(n)
+
+    def update(self):
+        """Process all pending events, then results of works done."""
+        super().update()
+        _Pool.of(self).flush()
+
+    def destroy(self):
+        """Destroy the app, shutting down its pool."""
+        _Pool.of(self).shutdown()
+        super().destroy()
+
+    def pool(self, workers: int = None, process: bool = False):
+        """Configure the pool running works of submit and offload.
+
+        Args:
+            workers (int, optional): Number of workers. Defaults to executor's default.
+            process (bool, optional): If works run in processes instead of threads. Defaults to False.
+        """
+        _Pool.of(self).configure(workers, process)
+
+    def latency(self) -> tuple[int, float, float]:
+        """Get UI latency measured by run_async's probe.
+
+        Returns:
+            tuple[int, float, float]: Number of samples, mean and max delay in ms.
+        """
+        samples, total, peak = self.__lags
+        return samples, total / samples if samples else 0., peak
+
+    def tclcommands(self) -> int:
+        """Count commands of the app's Tcl interpreter, with Tcl and Tk ones,
+        widgets, callbacks and variable traces.
+
+        Returns:
+            int: Number of commands.
+        """
+        return len(self.tk.splitlist(self.tk.call("info", "commands")))
+
+    def eventstats(self) -> dict[tuple[str, str], tuple[int, int]]:
+        """Get counts of received and delivered events of rate limited bindings.
+
+        Returns:
+            dict[tuple[str, str], tuple[int, int]]: (received, delivered) by (widget path, event).
+        """
+        return _Scheduler.of(self).stats()
+
     def loadfont(self, filepath: str):
-        """Load a font in app
+        """Load a font in app, once per app and file content.
 
         Args:
             filepath (str): Path to the font
         """
-        Font(self, file=filepath, name=Path(filepath).name)
+        _Fonts.load(self, filepath)
+
+    def fonts(self, **families: dict[str, str]):
+        """Declare font files, loaded the first time a widget's font uses their family.
+
+        Args:
+            **families (dict[str, str]): Font file path by family.
+        """
+        _Fonts.families.update(families)
+
+    def fonttimes(self) -> dict[str, float]:
+        """Get load time of font files.
+
+        Returns:
+            dict[str, float]: Load time in ms by file path.
+        """
+        return dict(_Fonts.times)
 
 
 # Load sequence as tuple (optimized)
@@ -0,0 +1,235 @@
+# coding: utf-8
+
+"""Profile the building of tkyml widgets
+
+Record, per widget path, construction time, time of each :attr: call and
+variant, along their Tcl round trips. Nothing is patched until enabled, either
+with enable() or through the environment variable TKYML_PROFILE:
+
+    TKYML_PROFILE=1           ->  Print a text report on exit.
+
+    TKYML_PROFILE=trace.json  ->  Write a Chrome trace on exit (chrome://tracing,
+                                  speedscope, perfetto, ...).
+
+    TKYML_PROFILE=report.txt  ->  Write a text report on exit.
+"""
+
+# Typing
+from __future__ import annotations
+from typing import Callable
+
+# To measure
+from time import perf_counter
+from functools import wraps
+
+# To restore interpreters
+from weakref import WeakSet
+
+# To export
+import atexit
+import json
+import os
+import sys
+
+# Profiled classes
+from .widgets import _BaseWidget, _DefaultInit, WIDGETS
+
+
+ENV = "TKYML_PROFILE"
+ROUND_TRIPS = ("call", "eval", "getvar", "setvar", "globalgetvar", "globalsetvar", "createcommand", "deletecommand")
+
+
+class _Record:
+
+    """A timed span of the build."""
+
+    __slots__ = ("name", "cat", "path", "start", "dur", "children", "tcl")
+
+    def __init__(self, name: str, cat: str, path: str) -> None:
+        self.name = name
+        self.cat = cat
+        self.path = path
+        self.dur = 0.
+        self.children = 0.
+        self.tcl = 0
+
+    def __enter__(self) -> _Record:
+        _stack.append(self)
+        self.start = perf_counter()
+        return self
+
+    def __exit__(self, *_: any):
+        self.dur = perf_counter() - self.start
+        _stack.pop()
+        if _stack:
+            _stack[-1].children += self.dur
+        _records.append(self)
+
+
+class _Counter:
+
+    """Count Tcl round trips of an interpreter, for the running span."""
+
+    def __init__(self, tk: any) -> None:
+        self.original = tk
+
+    def __getattr__(self, name: str) -> any:
+        attr = getattr(self.original, name)
+        if name in ROUND_TRIPS:
+            def counted(*args: any) -> any:
+                if _stack:
+                    _stack[-1].tcl += 1
+                return attr(*args)
+            setattr(self, name, counted)
+            return counted
+        return attr
+
+
+_records: list[_Record] = []
+_stack: list[_Record] = []
+_originals: dict[tuple[type, str], Callable] = {}
+_counted: WeakSet[_BaseWidget] = WeakSet()  # Widgets given a _Counter, shared with their descendants
+
+
+def __patch(cls: type, name: str, wrapper: Callable[[Callable], Callable]):
+    fn = cls.__dict__[name]
+    _originals[cls, name] = fn
+    setattr(cls, name, wraps(fn)(wrapper(fn)))
+
+
+def __set(fn: Callable) -> Callable:
+    def _set(self: _BaseWidget, values: dict[str, any]):
+        if not isinstance(self.tk, _Counter):
+            self.tk = _Counter(self.tk)
+            _counted.add(self)
+        with _Record("_set", "build", str(self)):
+            fn(self, values)
+    return _set
+
+
+def __setattr(fn: Callable) -> Callable:
+    def __setattr(self: _BaseWidget, name: str, value: any):
+        with _Record(":" + name, "attr", str(self)):
+            fn(self, name, value)
+    return __setattr
+
+
+def __variant(fn: Callable) -> Callable:
+    def _variant(self: _BaseWidget, values: dict[str, any]):
+        with _Record("_variant", "variant", str(self)):
+            fn(self, values)
+    return _variant
+
+
+def __init(fn: Callable) -> Callable:
+    def __init__(self: _BaseWidget, master: any, name: str, values: dict[str, any]):
+        path = f"{master._w.rstrip('.')}.{name}"
+        if _stack and _stack[-1].path == path and _stack[-1].cat == "new":
+            return fn(self, master, name, values)  # Call to super().__init__
+        with _Record(type(self).__name__, "new", path):
+            fn(self, master, name, values)
+    return __init__
+
+
+def enabled() -> bool:
+    """Check if profiling is enabled.
+
+    Returns:
+        bool: If widgets are profiled.
+    """
+    return bool(_originals)
+
+
+def enable():
+    """Start profiling widgets built from now on."""
+    if enabled():
+        return
+    __patch(_BaseWidget, "_set", __set)
+    __patch(_BaseWidget, "_BaseWidget__setattr", __setattr)
+    __patch(_BaseWidget, "_variant", __variant)
+    __patch(_DefaultInit, "__init__", __init)
+    for cls in vars(WIDGETS).values():
+        if isinstance(cls, type) and "__init__" in cls.__dict__:
+            __patch(cls, "__init__", __init)
+
+
+def disable():
+    """Stop profiling, records are kept."""
+    for (cls, name), fn in _originals.items():
+        setattr(cls, name, fn)
+    _originals.clear()
+    widgets = list(_counted)
+    while widgets:
+        widget = widgets.pop()
+        if isinstance(widget.tk, _Counter):
+            widget.tk = widget.tk.original
+        widgets.extend(widget.children.values())
+    _counted.clear()
+
+
+def reset():
+    """Remove all records."""
+    _records.clear()
+
+
+def report(limit: int = None) -> str:
+    """Make a text report, grouped by widget path and span, sorted by self time.
+
+    Args:
+        limit (int, optional): Maximum number of rows. Defaults to all.
+
+    Returns:
+        str: The report.
+    """
+    rows: dict[tuple[str, str], list] = {}
+    for record in _records:
+        row = rows.setdefault((record.path, record.name), [0, 0., 0., 0])
+        row[0] += 1
+        row[1] += record.dur - record.children
+        row[2] += record.dur
+        row[3] += record.tcl
+    lines = [f"{'self ms':>10} {'total ms':>10} {'tcl':>7} {'calls':>6}  path name"]
+    for (path, name), (calls, own, total, tcl) in sorted(rows.items(), key=lambda item: -item[1][1])[:limit]:
+        lines.append(f"{own * 1000:>10.3f} {total * 1000:>10.3f} {tcl:>7} {calls:>6}  {path} {name}")
+    return "\n".join(lines)
+
+
+def trace() -> dict[str, any]:
+    """Make a Chrome trace (flame graph compatible) of the records.
+
+    Returns:
+        dict[str, any]: The trace, to dump as json.
+    """
+    origin = min((record.start for record in _records), default=0.)
+    pid = os.getpid()
+    return {"traceEvents": [{
+        "name": f"{record.path} {record.name}",
+        "cat": record.cat,
+        "ph": "X",
+        "ts": (record.start - origin) * 1e6,
+        "dur": record.dur * 1e6,
+        "pid": pid,
+        "tid": 0,
+        "args": {"path": record.path, "tcl": record.tcl},
+    } for record in _records]}
+
+
+def dump(target: str):
+    """Write records to a file, as a Chrome trace if it ends by .json, else as a text report.
+
+    Args:
+        target (str): File's path, or "1" to print the report.
+    """
+    if target.endswith(".json"):
+        with open(target, 'w') as file:
+            json.dump(trace(), file)
+    elif target == "1":
+        print(report(), file=sys.stderr)
+    else:
+        with open(target, 'w') as file:
+            file.write(report())
+
+
+if os.environ.get(ENV):
+    enable()
+    atexit.register(dump, os.environ[ENV])
@@ -1,20 +1,39 @@
 # Typing
-from typing import Callable, Iterable, TypeAlias, Union, TypeVar
+from typing import Callable, Coroutine, Iterable, TypeAlias, Union, TypeVar
 from enum import StrEnum
 
 # For tkinter wigdget
-from inspect import ismethod
+from inspect import ismethod, iscoroutinefunction
 from tkinter import ttk
 import tkinter as tk
 
+# For rate limited events
+from time import monotonic
+from math import ceil, inf
+
+# For asynchronous handlers
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from collections import deque
+from threading import Lock, get_ident
+import asyncio
+
 # For image widgets
 from PIL import Image, ImageTk, ImageColor
-from itertools import count, cycle
+from itertools import chain, count, cycle
+
+# To load custom fonts
+from tkextrafont import Font
+from hashlib import sha256
+from pathlib import Path
+from time import perf_counter
 
-# For transparent widgets
-import win32gui
-import win32api
-import win32con
+# For transparent widgets (windows only)
+try:
+    import win32gui
+    import win32api
+    import win32con
+except ImportError:
+    win32gui = None
 
 
 _C = TypeVar('_C', bound=object)  # To decorate and keep track of classes' type
@@ -37,6 +56,625 @@ LABEL_ATTR = Prefix.ATTR + "label"
 MODE_ATTR = Prefix.ATTR + "mode"
 END = tk.END + "-1c"
 MODE_ERROR = TypeError("Mode not found, please refer to docstring.")
+HIDE_ERROR = NotImplementedError("Hiding colors is only available on windows.")
+LINK_ERROR = ValueError("Link path not found, please use <model>.<attribute>.")
+ASYNC_ERROR = RuntimeError("App isn't running asynchronously, please use App.run_async.")
+POOL_ERROR = RuntimeError("App is destroyed, its pool is shut down.")
+VALUE_ERROR = AttributeError("Widget has no value, please refer to docstring.")
+STREAM_ERROR = ValueError("Streams scroll their whole canvas, please give them their own canvas.")
+# Tcl lambda adding a chunk of menu entries in one call
+FILL_MENU = "{menu kind cmd offset labels} {foreach label $labels {$menu add $kind -label $label -command [list $cmd $offset]; incr offset}}"
+# Tcl lambdas creating, moving and showing canvas items in one call
+CREATE_ITEMS = "{canvas type tag options coords} {set ids {}; foreach c $coords {lappend ids [$canvas create $type $c -tags $tag {*}$options]}; return $ids}"
+MOVE_ITEMS = "{canvas ids coords} {foreach id $ids c $coords {$canvas coords $id $c}}"
+STATE_ITEMS = "{canvas ids state} {foreach id $ids {$canvas itemconfigure $id -state $state}}"
+APPEND_ITEM = "{canvas id coords scroll} {$canvas coords $id $coords; $canvas itemconfigure $id -state normal; if {$scroll} {$canvas xview scroll $scroll units}}"
+GROUP_TAG = "group:"  # Prefix of delegated events' bindtags
+
+
+def _callback(fn: Callable) -> Callable:
+    """Adapt a function to be called by an event.
+
+    Args:
+        fn (Callable): Function taking either the event or nothing.
+
+    Returns:
+        Callable: Function taking the event.
+    """
+    if fn.__code__.co_argcount - ismethod(fn):
+        return fn
+    return lambda _: fn()
+
+
+class _Binding:
+
+    """Event binding delivered through the app's scheduler.
+
+    Without throttle nor debounce, only the latest event is delivered per idle
+    cycle. Count received and delivered events to tune the rate limit.
+    """
+
+    received = 0
+    delivered = 0
+    __last = -inf
+
+    def __init__(self, scheduler: "_Scheduler", fn: Callable, throttle: int, debounce: int) -> None:
+        self.__scheduler = scheduler
+        self.__fn = fn
+        self.__throttle = throttle / 1000
+        self.__debounce = debounce / 1000
+
+    def __call__(self, ev: tk.Event):
+        self.received += 1
+        now = monotonic()
+        if self.__debounce:
+            self.__scheduler.push(self, now + self.__debounce, ev)
+        elif self.__throttle:
+            due = self.__last + self.__throttle
+            if due <= now and not self.__scheduler.pending(self):
+                self.deliver(ev)
+            else:
+                self.__scheduler.push(self, due, ev)
+        else:
+            self.__scheduler.push(self, now, ev)
+
+    def deliver(self, ev: tk.Event):
+        """Call the binded function.
+
+        Args:
+            ev (tk.Event): Latest event received.
+        """
+        self.delivered += 1
+        self.__last = monotonic()
+        self.__fn(ev)
+
+
+class _Scheduler:
+
+    """Deliver delayed events of an app with a single shared timer.
+    """
+
+    __id: str | None = None
+    __due = inf
+
+    def __init__(self, root: tk.Tk) -> None:
+        self.__root = root
+        self.__pending: dict[_Binding, tuple[float, tk.Event]] = {}
+        self.__bindings: dict[str, dict[str, list[_Binding]]] = {}
+
+    @classmethod
+    def of(cls, widget: tk.Misc) -> "_Scheduler":
+        """Get the scheduler of a widget's app.
+
+        Args:
+            widget (tk.Misc): Some widget.
+
+        Returns:
+            _Scheduler: The app's scheduler.
+        """
+        root = widget._root()
+        scheduler = getattr(root, "_scheduler", None)
+        if scheduler is None:
+            scheduler = root._scheduler = cls(root)
+        return scheduler
+
+    def __schedule(self, due: float):
+        if self.__id:
+            self.__root.after_cancel(self.__id)
+        delay = ceil((due - monotonic()) * 1000)
+        if delay > 0:
+            self.__id = self.__root.after(delay, self.__fire)
+        else:
+            self.__id = self.__root.after_idle(self.__fire)
+        self.__due = due
+
+    def __fire(self):
+        self.__id = None
+        self.__due = inf
+        now = monotonic()
+        ready = [(binding, ev) for binding, (due, ev) in self.__pending.items() if due <= now]
+        for binding, ev in ready:
+            del self.__pending[binding]
+            try:
+                binding.deliver(ev)
+            except Exception as err:
+                self.__root.report_callback_exception(type(err), err, err.__traceback__)
+        if self.__pending and not self.__id:
+            self.__schedule(min(due for due, _ in self.__pending.values()))
+
+    def binding(self, path: str, name: str, fn: Callable, throttle: int, debounce: int) -> _Binding:
+        """Create a rate limited binding, coalesced per idle cycle without
+        throttle nor debounce.
+
+        Args:
+            path (str): Path of the binded widget or tag.
+            name (str): Corresponding event.
+            fn (Callable): Function taking the event.
+            throttle (int): Minimal delay between two deliveries in ms.
+            debounce (int): Delay of quiet before delivery in ms.
+
+        Returns:
+            _Binding: The binding to give to tkinter.
+        """
+        binding = _Binding(self, fn, throttle, debounce)
+        self.__bindings.setdefault(path, {}).setdefault(name, []).append(binding)
+        return binding
+
+    def drop(self, path: str):
+        """Forget the bindings of a widget or tag, with their waiting events.
+
+        Args:
+            path (str): Path of the binded widget or tag.
+        """
+        for bindings in self.__bindings.pop(path, {}).values():
+            for binding in bindings:
+                self.__pending.pop(binding, None)
+
+    def pending(self, binding: _Binding) -> bool:
+        """Check if a binding has an event waiting.
+
+        Args:
+            binding (_Binding): Some binding.
+
+        Returns:
+            bool: If an event is waiting.
+        """
+        return binding in self.__pending
+
+    def push(self, binding: _Binding, due: float, ev: tk.Event):
+        """Replace the event waiting for a binding.
+
+        Args:
+            binding (_Binding): Some binding.
+            due (float): Time of delivery (from time.monotonic).
+            ev (tk.Event): Latest event.
+        """
+        self.__pending[binding] = (due, ev)
+        if due < self.__due:
+            self.__schedule(due)
+
+    def stats(self) -> dict[tuple[str, str], tuple[int, int]]:
+        """Get counts of received and delivered events per binding.
+
+        Returns:
+            dict[tuple[str, str], tuple[int, int]]: (received, delivered) by (path, event).
+        """
+        return {
+            (path, name): (sum(b.received for b in bindings), sum(b.delivered for b in bindings))
+            for path, names in self.__bindings.items()
+            for name, bindings in names.items()
+        }
+
+
+class _Task:
+
+    """Work running in the app's pool, with its result delivered in the app's thread.
+    """
+
+    cancelled = False
+    __done = False
+    __result: any = None
+    __error: BaseException | None = None
+
+    def __init__(self, root: tk.Tk, pool: "_Pool", future: Future) -> None:
+        self.__root = root
+        self.__pool = pool
+        self.__future = future
+        self.__callbacks: list[tuple[Callable | None, Callable | None]] = []
+        self._owner: set | None = None
+
+    def __call(self, callback: Callable | None, error: Callable | None):
+        try:
+            if self.__error is None:
+                if callback:
+                    callback(self.__result)
+            elif error:
+                error(self.__error)
+            else:
+                raise self.__error
+        except Exception as err:
+            self.__root.report_callback_exception(type(err), err, err.__traceback__)
+
+    def _deliver(self):
+        """Call the callbacks with the future's outcome, from the app's thread."""
+        if self._owner is not None:
+            self._owner.discard(self)
+        if self.cancelled or self.__future.cancelled():
+            return
+        self.__error = self.__future.exception()
+        if self.__error is None:
+            self.__result = self.__future.result()
+        self.__done = True
+        for callback, error in self.__callbacks:
+            self.__call(callback, error)
+        self.__callbacks.clear()
+
+    def __then(self, callback: Callable | None, error: Callable | None):
+        if self.__done:
+            self.__call(callback, error)
+        else:
+            self.__callbacks.append((callback, error))
+
+    def then(self, callback: Callable = None, error: Callable = None) -> "_Task":
+        """Add callbacks, called in the app's thread once work is done, from any thread.
+
+        Args:
+            callback (Callable, optional): Called with the result. Defaults to None.
+            error (Callable, optional): Called with the raised exception, else it's reported by the app. Defaults to None.
+
+        Returns:
+            _Task: The task itself.
+        """
+        self.__pool.call(self.__then, callback, error)
+        return self
+
+    def cancel(self) -> bool:
+        """Cancel the work, callbacks won't be called.
+
+        Returns:
+            bool: If the work was stopped before running.
+        """
+        self.cancelled = True
+        return self.__future.cancel()
+
+
+class _Pool:
+
+    """Run works in an executor, results and calls from other threads go back
+    through one queue drained by the app.
+
+    The app is woken up only when the queue stops being empty, calls posted
+    while it isn't in its mainloop wait for a flush (see App.update).
+    """
+
+    BATCH = 256  # Maximum calls per drain
+
+    __executor: Executor | None = None
+    __awake = False  # If a drain is scheduled
+    __closed = False
+
+    def __init__(self, root: tk.Tk) -> None:
+        self.__root = root
+        self.__thread = get_ident()  # App's thread
+        self.__queue: deque[tuple[Callable, tuple]] = deque()
+        self.__lock = Lock()
+
+    @classmethod
+    def of(cls, widget: tk.Misc) -> "_Pool":
+        """Get the pool of a widget's app.
+
+        Args:
+            widget (tk.Misc): Some widget.
+
+        Returns:
+            _Pool: The app's pool.
+        """
+        root = widget._root()
+        pool = getattr(root, "_pool", None)
+        if pool is None:
+            pool = root._pool = cls(root)
+        return pool
+
+    def __wake(self):
+        # Called from any thread, tkinter marshals it to the app's thread
+        try:
+            self.__root.after_idle(self.__drain)
+        except (RuntimeError, tk.TclError):
+            pass  # App isn't in its mainloop or destroyed, left to flush
+
+    def __drain(self):
+        for _ in range(self.BATCH):
+            with self.__lock:
+                if not self.__queue:
+                    self.__awake = False
+                    return
+                fn, args = self.__queue.popleft()
+            try:
+                fn(*args)
+            except Exception as err:
+                self.__root.report_callback_exception(type(err), err, err.__traceback__)
+        self.__wake()
+
+    def inthread(self) -> bool:
+        """Check if the caller runs in the app's thread.
+
+        Returns:
+            bool: If called from the app's thread.
+        """
+        return get_ident() == self.__thread
+
+    def post(self, fn: Callable, *args: any):
+        """Call a function in the app's thread on its next drain, from any thread.
+
+        Args:
+            fn (Callable): Some function.
+        """
+        with self.__lock:
+            if self.__closed:
+                return
+            self.__queue.append((fn, args))
+            if self.__awake:
+                return
+            self.__awake = True
+        self.__wake()
+
+    def flush(self):
+        """Drain the queue from the app's thread, for calls posted while the
+        app wasn't in its mainloop (so no drain could be scheduled).
+        """
+        if self.__queue:
+            self.__drain()
+
+    def call(self, fn: Callable, *args: any) -> any:
+        """Call a function in the app's thread, now if already in it, else on next drain.
+
+        Args:
+            fn (Callable): Some function.
+
+        Returns:
+            any: Function's result, None if it's posted.
+        """
+        if self.inthread():
+            return fn(*args)
+        self.post(fn, *args)
+
+    def configure(self, workers: int = None, process: bool = False):
+        """Replace the executor, the previous one finishes its works.
+
+        Args:
+            workers (int, optional): Number of workers. Defaults to executor's default.
+            process (bool, optional): If works run in processes instead of threads. Defaults to False.
+        """
+        if self.__executor:
+            self.__executor.shutdown(wait=False)
+        self.__executor = (ProcessPoolExecutor if process else ThreadPoolExecutor)(workers)
+
+    def submit(self, fn: Callable, *args: any, **kwargs: dict[str, any]) -> _Task:
+        """Run a function in the executor.
+
+        Args:
+            fn (Callable): Some function.
+
+        Returns:
+            _Task: The task, to add callbacks.
+        """
+        if self.__closed:
+            raise POOL_ERROR
+        if self.__executor is None:
+            self.configure()
+        future = self.__executor.submit(fn, *args, **kwargs)
+        task = _Task(self.__root, self, future)
+        future.add_done_callback(lambda _: self.post(task._deliver))
+        return task
+
+    def shutdown(self):
+        """Stop the executor, cancelling works not started, results are dropped."""
+        with self.__lock:
+            self.__closed = True
+            self.__queue.clear()
+        if self.__executor:
+            self.__executor.shutdown(wait=False, cancel_futures=True)
+            self.__executor = None
+
+
+class Model:
+
+    """Observable model, widgets linked to its attributes follow their changes.
+
+    Change it from any thread, linked widgets are updated in the app's thread
+    once per idle cycle. Functions given to observe are called in the thread
+    making the change.
+    """
+
+    def __init__(self, **values: dict[str, any]) -> None:
+        object.__setattr__(self, "_Model__observers", {})
+        for name, value in values.items():
+            setattr(self, name, value)
+
+    def __setattr__(self, name: str, value: any):
+        object.__setattr__(self, name, value)
+        for callback in tuple(self.__observers.get(name, ())):
+            callback(value)
+
+    def observe(self, name: str, callback: Callable):
+        """Call a function on each change of an attribute.
+
+        Args:
+            name (str): Attribute's name.
+            callback (Callable): Called with the new value.
+        """
+        self.__observers.setdefault(name, []).append(callback)
+
+    def unobserve(self, name: str, callback: Callable):
+        """Stop calling a function on changes of an attribute.
+
+        Args:
+            name (str): Attribute's name.
+            callback (Callable): Function given to observe.
+        """
+        callbacks = self.__observers.get(name)
+        if callbacks and callback in callbacks:
+            callbacks.remove(callback)
+
+
+class _Binder:
+
+    """Write models' changes to linked widgets, coalesced once per idle cycle.
+    """
+
+    __id: str | None = None
+
+    def __init__(self, root: tk.Tk) -> None:
+        self.__root = root
+        self.models: dict[str, Model] = {}
+        self.__pending: dict[str, list[tuple[tk.Misc, str, str]]] = {}
+        self.__links: dict[tk.Misc, list[tuple[Model, str, Callable]]] = {}
+        self.__dirty: dict[tk.Misc, dict[str, any]] = {}
+
+    @classmethod
+    def of(cls, widget: tk.Misc) -> "_Binder":
+        """Get the binder of a widget's app.
+
+        Args:
+            widget (tk.Misc): Some widget.
+
+        Returns:
+            _Binder: The app's binder.
+        """
+        root = widget._root()
+        binder = getattr(root, "_binder", None)
+        if binder is None:
+            binder = root._binder = cls(root)
+        return binder
+
+    def __flush(self):
+        self.__id = None
+        dirty, self.__dirty = self.__dirty, {}
+        for widget, options in dirty.items():
+            config = {}
+            for option, value in options.items():
+                attr = getattr(widget, option, None)
+                if isinstance(attr, tk.Variable):
+                    attr.set(value)
+                elif option == "value":
+                    if attr != value:
+                        widget.value = value
+                else:
+                    config[option] = value
+            if config:
+                widget.configure(config)
+
+    def __push(self, widget: tk.Misc, option: str, value: any):
+        self.__dirty.setdefault(widget, {})[option] = value
+        if not self.__id:
+            self.__id = self.__root.after_idle(self.__flush)
+
+    def push(self, widget: tk.Misc, option: str, value: any):
+        """Mark an option of a widget to be written, only its latest value is
+        kept, from any thread.
+
+        Args:
+            widget (tk.Misc): Linked widget.
+            option (str): Widget's option.
+            value (any): New value.
+        """
+        _Pool.of(self.__root).call(self.__push, widget, option, value)
+
+    def register(self, name: str, model: Model):
+        """Add a model, connecting links waiting for it.
+
+        Args:
+            name (str): Model's name in links.
+            model (Model): The model.
+        """
+        self.models[name] = model
+        for link in self.__pending.pop(name, ()):
+            self.link(*link)
+
+    def link(self, widget: tk.Misc, option: str, path: str):
+        """Link an option of a widget to a model's attribute.
+
+        Args:
+            widget (tk.Misc): Some widget.
+            option (str): Widget's option, "value" is two-way when widget support it.
+            path (str): Path of the attribute (<model>.<attribute>).
+
+        Raises:
+            LINK_ERROR: If path has no attribute.
+            VALUE_ERROR: If option is "value" and widget has none.
+        """
+        name, *attrs = path.split(".")
+        if not attrs:
+            raise LINK_ERROR
+        if option == "value" and not hasattr(widget, "value"):
+            raise VALUE_ERROR
+        model = self.models.get(name)
+        if model is None:
+            self.__pending.setdefault(name, []).append((widget, option, path))
+            return
+        for attr in attrs[:-1]:
+            model = getattr(model, attr)
+        attr = attrs[-1]
+
+        def callback(value: any):
+            self.push(widget, option, value)
+
+        model.observe(attr, callback)
+        self.__links.setdefault(widget, []).append((model, attr, callback))
+        if hasattr(model, attr):
+            self.push(widget, option, getattr(model, attr))
+        if option == "value" and hasattr(widget, "_watch"):
+            widget._watch(lambda value: setattr(model, attr, value))
+
+    def unlink(self, widget: tk.Misc):
+        """Remove links of a widget.
+
+        Args:
+            widget (tk.Misc): Some widget.
+        """
+        self.__dirty.pop(widget, None)
+        for model, attr, callback in self.__links.pop(widget, ()):
+            model.unobserve(attr, callback)
+
+
+class _Fonts:
+
+    """Font files declared for all windows of the process.
+
+    Declared families are loaded the first time a widget's font refers to
+    them. Files are read and hashed once per process, loaded once per app
+    (Tcl interpreter) by content hash.
+    """
+
+    families: dict[str, str] = {}  # File path by family
+    times: dict[str, float] = {}  # Load time in ms by file path
+    __digests: dict[str, str] = {}  # Content hash by file path
+
+    @classmethod
+    def load(cls, widget: tk.Misc, path: str) -> Font:
+        """Load a font file in a widget's app, if not already loaded.
+
+        A file with the same content as a loaded one isn't loaded again, its
+        named font is the one of the first file.
+
+        Args:
+            widget (tk.Misc): Some widget of the app.
+            path (str): Path to the font file.
+
+        Returns:
+            Font: The loaded font.
+        """
+        root = widget._root()
+        fonts = getattr(root, "_fonts", None)
+        if fonts is None:
+            fonts = root._fonts = {}  # Font by content hash, in this interpreter
+        digest = cls.__digests.get(path)
+        font = fonts.get(digest)
+        if font is None:
+            start = perf_counter()
+            if digest is None:
+                with open(path, 'rb') as file:
+                    digest = cls.__digests[path] = sha256(file.read()).hexdigest()
+            font = fonts.get(digest)
+            if font is None:
+                font = fonts[digest] = Font(root, file=path, name=Path(path).name)
+            cls.times[path] = (perf_counter() - start) * 1000
+        return font
+
+    @classmethod
+    def require(cls, widget: tk.Misc, font: any):
+        """Load the file of a font's family, if declared.
+
+        Args:
+            widget (tk.Misc): Widget using the font.
+            font (any): Font description, like "{Family} 12 bold" or (Family, 12).
+        """
+        if not cls.families or not font:
+            return
+        family = font[0] if isinstance(font, tuple) else widget.tk.splitlist(str(font))[0]
+        path = cls.families.get(family)
+        if path:
+            cls.load(widget, path)
 
 
 # Widgets bases class
@@ -45,6 +683,9 @@ MODE_ERROR = TypeError("Mode not found, please refer to docstring.")
 class _BaseWidget:
 
     __variants: dict[str, dict]  # Variant of the widget
+    __futures: set[Future | _Task] = ()  # Running coroutines and tasks of the widget
+    __linked = False  # If options are linked to models
+    __scheduled = False  # If events are rate limited
 
     def __attributes(self, callbacks: tuple[dict[str, any]]):
         """Call a bunc of functions of widget.
@@ -78,6 +719,8 @@ class _BaseWidget:
         elif __name == '':
             self.__attributes(__value)
         else:
+            if __name == "font":
+                _Fonts.require(self, __value)
             self.configure({__name: __value})
 
     def __hide(self, rgb: tuple[int]):
@@ -85,7 +728,12 @@ class _BaseWidget:
 
         Args:
             rgb (tuple[int]): RGB Color that will be hided.
+
+        Raises:
+            HIDE_ERROR: If not on windows.
         """
+        if win32gui is None:
+            raise HIDE_ERROR
         id = self.winfo_id()
         colorkey = win32api.RGB(*rgb)
         wnd_exstyle = win32gui.GetWindowLong(id, win32con.GWL_EXSTYLE)
@@ -155,24 +803,237 @@ class _BaseWidget:
         for child in self.winfo_children():
             child.destroy()
 
-    def event(self, name: str, add=True) -> Callable:
+    def _command(self, fn: Callable) -> Callable:
+        """Adapt a function taking nothing to be used as a command.
+
+        Args:
+            fn (Callable): Function or coroutine function.
+
+        Returns:
+            Callable: Function taking nothing.
+        """
+        if iscoroutinefunction(fn):
+            return lambda: self.spawn(fn())
+        return fn
+
+    def spawn(self, coro: Coroutine) -> Future:
+        """Run a coroutine in the app's asyncio loop, cancelled if widget is destroyed.
+
+        Args:
+            coro (Coroutine): Some coroutine.
+
+        Raises:
+            ASYNC_ERROR: If app isn't running with App.run_async.
+
+        Returns:
+            Future: Thread-safe future of the coroutine result.
+        """
+        loop = getattr(self._root(), "_loop", None)
+        if loop is None:
+            coro.close()
+            raise ASYNC_ERROR
+        future = asyncio.run_coroutine_threadsafe(coro, loop)
+        _Pool.of(self).call(self.__track, future)
+        return future
+
+    def __track(self, future: Future | _Task):
+        # In the app's thread, futures are cancelled along the widget
+        if not self.__futures:
+            self.__futures = set()
+        self.__futures.add(future)
+        if isinstance(future, _Task):
+            future._owner = self.__futures
+        else:
+            future.add_done_callback(lambda _: _Pool.of(self).post(self.__futures.discard, future))
+
+    def submit(self, fn: Callable, *args: any, **kwargs: dict[str, any]) -> _Task:
+        """Run a function in the app's pool, cancelled if widget is destroyed.
+
+        Args:
+            fn (Callable): Some function, picklable for a process pool.
+
+        Returns:
+            _Task: The task, use then() to get its result in the app's thread.
+        """
+        pool = _Pool.of(self)
+        task = pool.submit(fn, *args, **kwargs)
+        pool.call(self.__track, task)
+        return task
+
+    def offload(self, fn: Callable) -> Callable:
+        """Decorate a function to run it in the app's pool (see submit).
+
+        Args:
+            fn (Callable): Some function, only usable with a thread pool.
+
+        Returns:
+            Callable: Function returning a task.
+        """
+        def wrapper(*args: any, **kwargs: dict[str, any]) -> _Task:
+            return self.submit(fn, *args, **kwargs)
+        return wrapper
+
+    async def waitevent(self, name: str) -> tk.Event:
+        """Wait for some event of the widget, from the app's asyncio loop.
+
+        Args:
+            name (str): Corresponding event.
+
+        Returns:
+            tk.Event: The event.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        pool = _Pool.of(self)
+        funcids = []
+
+        def handler(ev: tk.Event):
+            loop.call_soon_threadsafe(lambda: future.done() or future.set_result(ev))
+
+        def bind():
+            funcids.append(self.bind(name, handler, True))
+
+        def unbind():
+            for funcid in funcids:
+                self.__unbind(name, funcid)
+
+        # Bind and unbind in the app's thread, in this order
+        pool.post(bind)
+        try:
+            return await future
+        finally:
+            pool.post(unbind)
+
+    def __unbind(self, name: str, funcid: str):
+        try:
+            script = self.tk.call("bind", self._w, name)
+            self.tk.call("bind", self._w, name, "\n".join(
+                line for line in script.split("\n") if funcid not in line))
+            self.deletecommand(funcid)
+        except tk.TclError:
+            pass  # Widget is destroyed, along its commands
+
+    def destroy(self):
+        """Destroy this and all descendants widgets, cancelling their coroutines,
+        links and waiting events."""
+        for future in tuple(self.__futures):
+            future.cancel()
+        if self.__linked:
+            _Binder.of(self).unlink(self)
+        if self.__scheduled:
+            _Scheduler.of(self).drop(str(self))
+        super().destroy()
+
+    def link(self, **options: dict[str, str]):
+        """Link options to models' attributes, updated once per idle cycle.
+
+        Option "value" is two-way on Entry, Text, Scale and OptionMenu, an
+        OptionMenu shows the label of the value's entry.
+
+        Args:
+            **options (dict[str, str]): Attribute path (<model>.<attribute>) by option.
+
+        Raises:
+            LINK_ERROR: If a path has no attribute.
+            VALUE_ERROR: If option "value" is linked on a widget without value.
+        """
+        binder = _Binder.of(self)
+        self.__linked = True
+        for option, path in options.items():
+            binder.link(self, option, path)
+
+    def _handler(self, path: str, name: str, fn: Callable, throttle: int, debounce: int, coalesce: bool) -> Callable:
+        """Adapt a function to an event, rate limited if asked.
+
+        Args:
+            path (str): Path of the binded widget or tag.
+            name (str): Corresponding event.
+            fn (Callable): Function taking either the event or nothing.
+            throttle (int): Minimal delay between two calls in ms.
+            debounce (int): Delay of quiet before a call in ms.
+            coalesce (bool): If only the latest event is delivered per idle cycle.
+
+        Returns:
+            Callable: Function taking the event.
+        """
+        if iscoroutinefunction(fn):
+            coro = _callback(fn)
+            fn = lambda ev: self.spawn(coro(ev))
+        else:
+            fn = _callback(fn)
+        if throttle or debounce or coalesce:
+            if path == str(self):
+                self.__scheduled = True
+            return _Scheduler.of(self).binding(path, name, fn, throttle, debounce)
+        return fn
+
+    def event(self, name: str, add=True, throttle: int = 0, debounce: int = 0, coalesce: bool = False) -> Callable:
         """Link a function to some event. 
 
         Args:
             name (str): Corresponding event.
             add (bool, optional): If we add or overwrite the current function binded. Defaults to False.
+            throttle (int, optional): Minimal delay between two calls in ms, latest event is kept. Defaults to 0.
+            debounce (int, optional): Delay without event before a call in ms. Defaults to 0.
+            coalesce (bool, optional): If only the latest event is delivered per idle cycle. Defaults to False.
 
         Returns:
             Callable: Sub wrapper function.
         """
         def wrapper(fn: Callable) -> Callable:
-            if fn.__code__.co_argcount - ismethod(fn):
-                self.bind(name, fn, add)
-            else:
-                self.bind(name, lambda _: fn(), add)
+            self.bind(name, self._handler(str(self), name, fn, throttle, debounce, coalesce), add)
+            return fn
+        return wrapper
+
+    def delegate(self, group: str, name: str, add=True, throttle: int = 0, debounce: int = 0, coalesce: bool = False) -> Callable:
+        """Link a function to some event of every widget in a group.
+
+        The function is registered once on the group's bindtag, owned by the
+        app so it outlives this widget, the target widget is reachable through
+        the event (ev.widget).
+
+        Args:
+            group (str): Corresponding group.
+            name (str): Corresponding event.
+            add (bool, optional): If we add or overwrite the current function binded. Defaults to True.
+            throttle (int, optional): Minimal delay between two calls in ms, latest event is kept. Defaults to 0.
+            debounce (int, optional): Delay without event before a call in ms. Defaults to 0.
+            coalesce (bool, optional): If only the latest event is delivered per idle cycle. Defaults to False.
+
+        Returns:
+            Callable: Sub wrapper function.
+        """
+        def wrapper(fn: Callable) -> Callable:
+            tag = GROUP_TAG + group
+            root = self._root()
+            root.bind_class(tag, name, root._handler(tag, name, fn, throttle, debounce, coalesce), add)
             return fn
         return wrapper
 
+    def joingroup(self, names: str | Iterable[str]):
+        """Join some groups, to receive their delegated events.
+
+        Args:
+            names (str | Iterable[str]): Group name or names.
+        """
+        if isinstance(names, str):
+            names = (names,)
+        tags = self.bindtags()
+        added = tuple(GROUP_TAG + name for name in names if GROUP_TAG + name not in tags)
+        if added:
+            self.bindtags(tags[:1] + added + tags[1:])
+
+    def leavegroup(self, names: str | Iterable[str]):
+        """Leave some groups.
+
+        Args:
+            names (str | Iterable[str]): Group name or names.
+        """
+        if isinstance(names, str):
+            names = (names,)
+        removed = {GROUP_TAG + name for name in names}
+        self.bindtags(tuple(tag for tag in self.bindtags() if tag not in removed))
+
     def hidecl(self, color: _Ink):
         """Hide some color
 
@@ -232,6 +1093,7 @@ class _TtkWidget(_Widget):
             **values (dict[str, any]): Styles key & values.
         """
         stylename = f"""{self.winfo_name()}.{self.winfo_class()}"""
+        _Fonts.require(self, values.get("font"))
         ttk.Style().configure(stylename, **values)
         self.configure(style=stylename)
 
@@ -272,6 +1134,47 @@ class _Entry:
         """
         self.delete(0, tk.END)
 
+    def _watch(self, callback: Callable):
+        """Call a function on each change of the text.
+
+        Args:
+            callback (Callable): Called with the new text.
+        """
+        self.__var = tk.StringVar(self, self.get())
+        self.configure(textvariable=self.__var)
+        self.__var.trace_add("write", lambda *_: callback(self.__var.get()))
+
+
+class _Scale:
+
+    @property
+    def value(self) -> float:
+        """Get actual value.
+
+        Returns:
+            float: Widget's value
+        """
+        return self.get()
+
+    @value.setter
+    def value(self, value: float):
+        """Overwrite value.
+
+        Args:
+            value (float): New value
+        """
+        self.set(value)
+
+    def _watch(self, callback: Callable):
+        """Call a function on each change of the value.
+
+        Args:
+            callback (Callable): Called with the new value.
+        """
+        self.__var = tk.DoubleVar(self, self.get())
+        self.configure(variable=self.__var)
+        self.__var.trace_add("write", lambda *_: callback(self.__var.get()))
+
 
 class _Img:
 
@@ -299,11 +1202,138 @@ class _Img:
                 raise MODE_ERROR
 
 
-class _OptionMenu:
+class _LazyMenu:
+
+    """Populate a menu from data sources only when it is posted.
+
+    Sources are either an iterable or a callable returning one, yielding labels,
+    (label, value) pairs or a mapping of them. Entries are appended after the
+    static ones, built in chunks of CHUNK per Tcl call, and kept until refresh().
+    """
+
+    CHUNK = 512
+
+    _menu: tk.Menu
+    _sources: list[tuple[str, any, Callable]] = ()
+    __entries: list[tuple[any, any, Callable]] = ()
+    __index: dict[any, int] = {}
+    __labels: dict[any, any] = {}
+    __start = 0
+    __stale = False
+    __cmd: str
+
+    def __post(self):
+        if self.__stale:
+            self.__build()
+
+    def __invoke(self, offset: str):
+        label, value, handler = self.__entries[int(offset)]
+        handler(label, value)
+
+    def __build(self):
+        menu = self._menu
+        if self.__entries:
+            # Not Menu.delete, lazy entries' commands aren't Tcl commands
+            menu.tk.call(menu._w, "delete", self.__start, self.__start + len(self.__entries) - 1)
+        last = menu.index(tk.END)
+        self.__start = 0 if last is None else last + 1
+        entries = self.__entries = []
+        index = self.__index = {}
+        values = self.__labels = {}
+        for kind, source, handler in self._sources:
+            items = source() if callable(source) else source
+            if isinstance(items, dict):
+                items = items.items()
+            first = len(entries)
+            for item in items:
+                label, value = item if isinstance(item, tuple) else (item, None)
+                index.setdefault(label, len(entries))
+                try:
+                    values.setdefault(value, label)
+                except TypeError:
+                    pass  # Unhashable value
+                entries.append((label, value, handler))
+            labels = tuple(label for label, _, _ in entries[first:])
+            for i in range(0, len(labels), self.CHUNK):
+                self.tk.call("apply", FILL_MENU, menu._w, kind, self.__cmd,
+                             first + i, labels[i:i + self.CHUNK])
+        self.__stale = False
+
+    def _lazy(self, kind: str, source: Iterable[any] | Callable, handler: Callable):
+        """Register a data source, turned into entries on next post.
+
+        Args:
+            kind (str): Kind of entries (command, radiobutton or checkbutton).
+            source (Iterable[any] | Callable): Data source or function returning it.
+            handler (Callable): Called with (label, value) when an entry is invoked.
+        """
+        if not self._sources:
+            self._sources = []
+            self.__cmd = self._register(self.__invoke)
+            self._menu.configure(postcommand=self.__post)
+        self._sources.append((kind, source, handler))
+        self.__stale = True
+
+    def refresh(self):
+        """Signal a change of the data sources, entries are rebuilt on next post.
+        """
+        self.__stale = True
+
+    def entryindex(self, label: any) -> int | None:
+        """Get index of a lazy entry by its label, in constant time.
+
+        Args:
+            label (any): Entry's label.
+
+        Returns:
+            int | None: Menu index of the entry, None if not built.
+        """
+        offset = self.__index.get(label)
+        return None if offset is None else self.__start + offset
+
+    def entrylabel(self, value: any) -> any:
+        """Get label of the first lazy entry of a value, building entries if needed.
+
+        Args:
+            value (any): Entry's value.
+
+        Returns:
+            any: Entry's label, None if not found.
+        """
+        if self.__stale:
+            self.__build()
+        try:
+            return self.__labels.get(value)
+        except TypeError:
+            return None
+
+
+class _OptionMenu(_LazyMenu):
     
     _menu: tk.Menu
     label: tk.StringVar
-    value = None
+    __value: any = None
+
+    @property
+    def value(self) -> any:
+        """Get current value.
+
+        Returns:
+            any: Current value.
+        """
+        return self.__value
+
+    @value.setter
+    def value(self, value: any):
+        """Set current value, and the label of its entry if any.
+
+        Args:
+            value (any): New value.
+        """
+        self.__value = value
+        label = self.entrylabel(value)
+        if label is not None:
+            self.label.set(label)
 
     def default(self, label: str, value: any = None):
         """Set default label & value.
@@ -313,54 +1343,171 @@ class _OptionMenu:
             value (any, optional): Default value. Defaults to None.
         """
         self.label.set(label)
-        self.value = value
+        self.__value = value
 
-    def __select_cmd(self, label: str, value: any):
-        def __cmd():
-            self.label.set(label)
-            self.value = value
-            self.event_generate(Event.CHANGE)
-        return __cmd
+    def __select(self, label: str, value: any):
+        self.label.set(label)
+        self.__value = value
+        self.event_generate(Event.CHANGE)
 
-    def select(self, **label_values: dict[str, any]):
+    def select(self, source: Iterable[any] | Callable = (), /, **label_values: dict[str, any]):
         """Add select command, that change menu label and value.
 
         Args:
+            source (Iterable[any] | Callable, optional): Lazy data source of (label, value). Defaults to ().
             label_values** (dict[str, any]): Combinaison of key-values.
         """
-        for label, value in label_values.items():
-            self._menu.add_command(label=label, command=self.__select_cmd(label, value))
+        self._lazy("command", source or label_values, self.__select)
 
-    def __choice_cmd(self, value: any):
-        def __cmd():
-            self.value = value
-            self.event_generate(Event.CHANGE)
-        return __cmd
+    def __choice(self, label: str, value: any):
+        self.__value = value
+        self.event_generate(Event.CHANGE)
 
-    def choice(self, **label_values: Iterable[any]):
+    def choice(self, source: Iterable[any] | Callable = (), /, **label_values: Iterable[any]):
         """Add select command, that change menu value.
 
         Args:
+            source (Iterable[any] | Callable, optional): Lazy data source of (label, value). Defaults to ().
             label_values** (dict[str, any]): Combinaison of key-values.
         """
-        for label, value in label_values.items():
-            self._menu.add_radiobutton(label=label, command=self.__choice_cmd(value))
+        self._lazy("radiobutton", source or label_values, self.__choice)
 
-    def __flag_cmd(self, label: str, flag: int):
-        def __cmd():
-            self.label.set(label)
-            self.value = self.value ^ flag
-            self.event_generate(Event.CHANGE)
-        return __cmd
+    def __flag(self, label: str, flag: int):
+        self.label.set(label)
+        self.__value = self.__value ^ flag
+        self.event_generate(Event.CHANGE)
 
-    def flags(self, **label_flags):
+    def flags(self, source: Iterable[any] | Callable = (), /, **label_flags):
         """Add select command, that change menu value with binaray flags.
 
         Args:
+            source (Iterable[any] | Callable, optional): Lazy data source of (label, flag). Defaults to ().
             label_flags** (dict[str, any]): Combinaison of key-values.
         """
-        for label, flag in label_flags.items():
-            self._menu.add_checkbutton(label=label, command=self.__flag_cmd(label, flag))
+        self._lazy("checkbutton", source or label_flags, self.__flag)
+
+    def _watch(self, callback: Callable):
+        """Call a function on each change of the value.
+
+        Args:
+            callback (Callable): Called with the new value.
+        """
+        self.bind(Event.CHANGE, lambda _: callback(self.value), True)
+
+
+def _floats(buffer: Iterable[float] | Iterable[Iterable[float]]) -> tuple[float]:
+    """Flatten coordinates from a sequence, an array.array or a numpy array.
+
+    Args:
+        buffer (Iterable[float] | Iterable[Iterable[float]]): Flat or (x, y) pairs coordinates.
+
+    Returns:
+        tuple[float]: Flat coordinates, converted to a Tcl list without formatting.
+    """
+    if hasattr(buffer, "ravel"):
+        buffer = buffer.ravel()
+    if hasattr(buffer, "tolist"):
+        buffer = buffer.tolist()
+    if buffer and isinstance(buffer[0], (tuple, list)):
+        return tuple(chain.from_iterable(buffer))
+    return tuple(buffer)
+
+
+def _options(options: dict[str, any]) -> tuple[str]:
+    """Convert options to Tcl arguments.
+
+    Args:
+        options (dict[str, any]): Some options.
+
+    Returns:
+        tuple[str]: Options as (-name, value, ...).
+    """
+    return tuple(chain.from_iterable((f"-{name}", value) for name, value in options.items()))
+
+
+class _ItemGroup:
+
+    """Canvas items sharing a type and options, created and moved in bulk.
+
+    Items are kept hidden when unused, to be reused by the next draw.
+    """
+
+    def __init__(self, canvas: tk.Canvas, tag: str, type: str, options: dict[str, any]) -> None:
+        self.__canvas = canvas
+        self.__tag = tag
+        self.type = type
+        self.__values = dict(options)
+        self.__options = _options(options)
+        self.ids: tuple[str] = ()
+        self.shown = 0
+
+    def configure(self, options: dict[str, any]):
+        """Change options of all items, current and next ones.
+
+        Args:
+            options (dict[str, any]): Some options.
+        """
+        self.__values.update(options)
+        self.__options = _options(self.__values)
+        if self.ids and options:
+            self.__canvas.itemconfigure(self.__tag, **options)
+
+    def draw(self, coords: Iterable[Iterable[float]]):
+        """Set coordinates of all items, one item per coordinates.
+
+        Args:
+            coords (Iterable[Iterable[float]]): Coordinates of each item (polylines as flat or (x, y) pairs).
+        """
+        canvas = self.__canvas
+        if hasattr(coords, "tolist"):
+            coords = coords.tolist()
+        coords = tuple(_floats(item) for item in coords)
+        reused = min(len(coords), len(self.ids))
+        if reused:
+            canvas.tk.call("apply", MOVE_ITEMS, canvas._w, self.ids[:reused], coords[:reused])
+        if len(coords) > len(self.ids):
+            self.ids += canvas.tk.splitlist(canvas.tk.call(
+                "apply", CREATE_ITEMS, canvas._w, self.type, self.__tag, self.__options, coords[reused:]))
+        if self.shown > len(coords):
+            canvas.tk.call("apply", STATE_ITEMS, canvas._w, self.ids[len(coords):self.shown], tk.HIDDEN)
+        elif self.shown < reused:
+            canvas.tk.call("apply", STATE_ITEMS, canvas._w, self.ids[self.shown:reused], tk.NORMAL)
+        self.shown = len(coords)
+
+
+class _Stream:
+
+    """Time series drawn as a ring of line segments, scrolling the canvas.
+
+    Appending a sample moves the oldest segment, so it costs one Tcl call
+    whatever the capacity. As the whole canvas scrolls, it only holds streams.
+    """
+
+    __count = 0
+    __last: float = None
+
+    def __init__(self, canvas: "WIDGETS.Canvas", tag: str, capacity: int, step: int, options: dict[str, any]) -> None:
+        self.__canvas = canvas
+        self.__step = step
+        self.__ids = canvas.tk.splitlist(canvas.tk.call(
+            "apply", CREATE_ITEMS, canvas._w, "line", tag, _options({"state": tk.HIDDEN, **options}),
+            ((0, 0, 0, 0),) * capacity))
+        canvas.configure(confine=False, xscrollincrement=step)
+
+    def append(self, value: float):
+        """Add a sample at the end.
+
+        Args:
+            value (float): Sample's y coordinate.
+        """
+        if self.__last is not None:
+            canvas = self.__canvas
+            x = self.__count * self.__step
+            scroll = canvas._scroll(self.__count - len(self.__ids))
+            canvas.tk.call("apply", APPEND_ITEM, canvas._w, self.__ids[self.__count % len(self.__ids)],
+                           (x - self.__step, self.__last, x, value), scroll)
+        self.__last = value
+        self.__count += 1
 
 
 class _DefaultInit:
@@ -442,10 +1589,11 @@ class WIDGETS:
             self.configure(image=next(self.__frames))
             self.__id = self.after(self.__delay, self.__update)
 
+        @staticmethod
         def __resize_frame(img: Image.Image, size: tuple[int]):
             img = img.copy()
             img.thumbnail(size)
-            return ImageTk.PhotoImage(img, Image.ANTIALIAS)
+            return ImageTk.PhotoImage(img)
 
         def _resize_contain(self, ev: tk.Event):
             self.after_cancel(self.__id)
@@ -517,7 +1665,93 @@ class WIDGETS:
         ...
 
     class Canvas(_DefaultInit, _Widget, tk.Canvas):
-        ...
+
+        """Canvas widget with item groups and streams, drawn in bulk
+        """
+
+        __groups: dict[str, _ItemGroup] = {}
+        __streams: dict[str, _Stream] = {}
+        __scrolled = 0  # Units scrolled by streams
+
+        def __init__(self, master: tk.Widget, name: str, values: dict[str, any]) -> None:
+            self.__groups = {}
+            self.__streams = {}
+            super().__init__(master, name, values)
+
+        def _scroll(self, units: int) -> int:
+            """Get units to scroll so a stream's last sample is visible.
+
+            Args:
+                units (int): Units the stream needs to be scrolled of.
+
+            Returns:
+                int: Units left to scroll.
+            """
+            scroll = max(0, units - self.__scrolled)
+            self.__scrolled += scroll
+            return scroll
+
+        def items(self, **groups: dict[str, dict[str, any]]):
+            """Add groups of items, tagged by their name. An existing group of
+            the same type is updated (e.g. by a variant), else replaced.
+
+            Args:
+                **groups (dict[str, dict[str, any]]): Items by group name, like { type: line, coords: [...], **options }.
+
+            Raises:
+                STREAM_ERROR: If canvas holds streams.
+            """
+            if self.__streams:
+                raise STREAM_ERROR
+            for tag, values in groups.items():
+                values = dict(values)
+                type, coords = values.pop("type"), values.pop("coords", None)
+                group = self.__groups.get(tag)
+                if group is None or group.type != type:
+                    if group is not None:
+                        self.delete(tag)
+                    group = self.__groups[tag] = _ItemGroup(self, tag, type, values)
+                else:
+                    group.configure(values)
+                if coords is not None:
+                    group.draw(coords)
+
+        def draw(self, tag: str, coords: Iterable[Iterable[float]]):
+            """Update a group of items in bulk, reusing its items.
+
+            Args:
+                tag (str): Group name.
+                coords (Iterable[Iterable[float]]): Coordinates of each item, sequences or arrays.
+            """
+            self.__groups[tag].draw(coords)
+
+        def stream(self, tag: str, capacity: int, step: int = 1, **options: dict[str, any]):
+            """Add a scrolling time series, see append.
+
+            Streams scroll the whole canvas, so it must only hold streams of
+            the same step.
+
+            Args:
+                tag (str): Stream name.
+                capacity (int): Number of visible samples, capacity * step should match canvas width.
+                step (int, optional): Distance between two samples in pixels. Defaults to 1.
+                **options (dict[str, any]): Line options.
+
+            Raises:
+                STREAM_ERROR: If canvas holds item groups.
+            """
+            if self.__groups:
+                raise STREAM_ERROR
+            self.__streams[tag] = _Stream(self, tag, capacity, step, options)
+
+        def append(self, tag: str, value: float):
+            """Add a sample to a stream, in one Tcl call.
+
+            Args:
+                tag (str): Stream name.
+                value (float): Sample's y coordinate.
+            """
+            self.__streams[tag].append(value)
 
     class Checkbutton(_DefaultInit, _Widget, tk.Checkbutton):
         ...
@@ -537,9 +1771,12 @@ class WIDGETS:
     class Listbox(_DefaultInit, _Widget, tk.Listbox):
         ...
 
-    class Menu(_DefaultInit, _Widget, tk.Menu):
+    class Menu(_DefaultInit, _Widget, _LazyMenu, tk.Menu):
+
+        __commands: dict[str, Callable] = {}
 
         def __init__(self, master: tk.Widget, name: str, values: dict[str, any]) -> None:
+            self.__commands = {}
             if isinstance(master, self.__class__):
                 label = values.pop(LABEL_ATTR)
                 super().__init__(master, name, values)
@@ -548,8 +1785,25 @@ class WIDGETS:
                 super().__init__(master, name, values)
                 master.config(menu=self)
 
+        @property
+        def _menu(self) -> tk.Menu:
+            return self
+
+        def __command(self, label: str, _: any):
+            fn = self.__commands.get(label)
+            if fn:
+                fn()
+
+        def __add(self, kind: str, labels: Iterable[str] | Callable, lazy: bool):
+            if lazy or callable(labels):
+                self._lazy(kind, labels, self.__command)
+            else:
+                for label in labels:
+                    self.add(kind, label=label)
+
         def entry(self, label: str) -> Callable:
-            """Link a function to a Menubutton by his label. 
+            """Link a function to a Menubutton by his label. In a menu with lazy
+            entries, only those are linked, when invoked.
 
             Args:
                 label (str): Corresponding label.
@@ -558,36 +1812,38 @@ class WIDGETS:
                 Callable: Sub wrapper function.
             """
             def wrapper(fn: Callable) -> Callable:
-                self.entryconfigure(label, command=fn)
+                command = self.__commands[label] = self._command(fn)
+                if not self._sources:
+                    self.entryconfigure(label, command=command)
                 return fn
             return wrapper
 
-        def button(self, labels: list[str]):
+        def button(self, labels: Iterable[str] | Callable, lazy: bool = False):
             """Add multiple normal buttons.
 
             Args:
-                labels (list[str]): List of buttons' label.
+                labels (Iterable[str] | Callable): List of buttons' label, or a lazy data source.
+                lazy (bool, optional): If buttons are only added when menu is posted. Defaults to False.
             """
-            for label in labels:
-                self.add_command(label=label)
+            self.__add("command", labels, lazy)
 
-        def choice(self, labels: list[str]):
+        def choice(self, labels: Iterable[str] | Callable, lazy: bool = False):
             """Add multiple radio buttons.
 
             Args:
-                labels (list[str]): List of buttons' label.
+                labels (Iterable[str] | Callable): List of buttons' label, or a lazy data source.
+                lazy (bool, optional): If buttons are only added when menu is posted. Defaults to False.
             """
-            for label in labels:
-                self.add_radiobutton(label=label)
+            self.__add("radiobutton", labels, lazy)
 
-        def check(self, labels: list[str]):
+        def check(self, labels: Iterable[str] | Callable, lazy: bool = False):
             """Add multiple check buttons.
 
             Args:
-                labels (list[str]): List of buttons' label.
+                labels (Iterable[str] | Callable): List of buttons' label, or a lazy data source.
+                lazy (bool, optional): If buttons are only added when menu is posted. Defaults to False.
             """
-            for label in labels:
-                self.add_checkbutton(label=label)
+            self.__add("checkbutton", labels, lazy)
 
     class Menubutton(_DefaultInit, _Widget, tk.Menubutton):
 
@@ -632,7 +1888,7 @@ class WIDGETS:
     class Radiobutton(_DefaultInit, _Widget, tk.Radiobutton):
         ...
 
-    class Scale(_DefaultInit, _Widget, tk.Scale):
+    class Scale(_DefaultInit, _Widget, _Scale, tk.Scale):
         ...
 
     class Scrollbar(_DefaultInit, _Widget, tk.Scrollbar):
@@ -667,6 +1923,19 @@ class WIDGETS:
             """
             self.delete("1.0", tk.END)
 
+        def __modified(self, callback: Callable):
+            if self.edit_modified():
+                self.edit_modified(False)
+                callback(self.value)
+
+        def _watch(self, callback: Callable):
+            """Call a function on each change of the text.
+
+            Args:
+                callback (Callable): Called with the new text.
+            """
+            self.bind("<<Modified>>", lambda _: self.__modified(callback), True)
+
     class Widget(_DefaultInit, _Widget, tk.Widget):
         ...
 
@@ -725,7 +1994,7 @@ class WIDGETS:
     class TRadiobutton(_DefaultInit, _TtkWidget, ttk.Radiobutton):
         ...
 
-    class TScale(_DefaultInit, _TtkWidget, ttk.Scale):
+    class TScale(_DefaultInit, _TtkWidget, _Scale, ttk.Scale):
         ...
 
     class TScrollbar(_DefaultInit, _TtkWidget, ttk.Scrollbar):
@@ -0,0 +1,70 @@
+# coding: utf-8
+"""Tests of lazy menus, on a real Tk interpreter."""
+
+import tkinter as tk
+
+import pytest
+
+from tkyml.widgets import WIDGETS
+
+
+@pytest.fixture
+def root() -> tk.Tk:
+    try:
+        root = tk.Tk()
+    except tk.TclError:
+        pytest.skip("No display")
+    yield root
+    root.destroy()
+
+
+def post(menu: tk.Menu):
+    menu.tk.eval(menu.cget("postcommand"))
+
+
+def labels(menu: tk.Menu) -> list[str]:
+    last = menu.index(tk.END)
+    return [menu.entrycget(i, "label") for i in range(0 if last is None else last + 1)]
+
+
+def test_lazy_build(root: tk.Tk):
+    menu = WIDGETS.Menu(root, "menu", {":button": {"labels": ("static",)}})
+    menu.button(lambda: [f"item {i}" for i in range(3)], lazy=True)
+    assert labels(menu) == ["static"]
+    post(menu)
+    assert labels(menu) == ["static", "item 0", "item 1", "item 2"]
+    assert menu.entryindex("item 1") == 2
+
+
+def test_lazy_rebuild(root: tk.Tk):
+    items = ["a", "b", "c"]
+    menu = WIDGETS.Menu(root, "menu", {})
+    menu.button(lambda: items, lazy=True)
+    post(menu)
+    items = ["d", "e"]
+    menu.refresh()
+    post(menu)
+    assert labels(menu) == ["d", "e"]
+    post(menu)  # Cached until refreshed
+    assert labels(menu) == ["d", "e"]
+
+
+def test_lazy_entry(root: tk.Tk):
+    invoked = []
+    menu = WIDGETS.Menu(root, "menu", {":button": {"labels": ("b",)}})
+    menu.button(("a", "b"), lazy=True)
+    menu.entry("b")(lambda: invoked.append("b"))
+    post(menu)
+    menu.invoke(0)  # Static entry isn't linked
+    assert invoked == []
+    menu.invoke(menu.entryindex("b"))
+    assert invoked == ["b"]
+
+
+def test_option_value(root: tk.Tk):
+    options = WIDGETS.OptionMenu(root, "options", {":select": {"one": 1, "two": 2}})
+    options.value = 2
+    assert options.label.get() == "two"
+    options.refresh()
+    options.value = 1
+    assert options.label.get() == "one"
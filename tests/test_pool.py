@@ -0,0 +1,135 @@
+# coding: utf-8
+"""Tests of the pool and its tasks, on a fake root pumped by hand."""
+
+from queue import Empty, SimpleQueue
+from threading import Event
+from time import monotonic
+
+import pytest
+
+from tkyml.widgets import _BaseWidget, _Pool
+
+TIMEOUT = 5
+
+
+class Root:
+
+    """Fake root, running idle callbacks when pumped, marshalling them from
+    other threads only while looping like tkinter.
+    """
+
+    looping = True
+
+    def __init__(self) -> None:
+        self.idle: SimpleQueue[callable] = SimpleQueue()
+        self.errors: list[BaseException] = []
+
+    def _root(self) -> "Root":
+        return self
+
+    def after_idle(self, fn: callable):
+        if not self.looping:
+            raise RuntimeError("main thread is not in main loop")
+        self.idle.put(fn)
+
+    def report_callback_exception(self, type: type, err: BaseException, traceback: any):
+        self.errors.append(err)
+
+    def step(self, timeout: float = TIMEOUT) -> bool:
+        """Run the next idle callback, waiting for it."""
+        try:
+            self.idle.get(timeout=timeout)()
+        except Empty:
+            return False
+        return True
+
+    def until(self, condition: callable):
+        """Pump until a condition holds."""
+        while not condition():
+            assert self.step(), "Nothing to run"
+
+
+class Base:
+
+    def destroy(self):
+        pass
+
+
+class Widget(_BaseWidget, Base):
+
+    def __init__(self, root: Root) -> None:
+        self.root = root
+
+    def _root(self) -> Root:
+        return self.root
+
+
+@pytest.fixture
+def root() -> Root:
+    root = Root()
+    yield root
+    _Pool.of(root).shutdown()
+
+
+def test_then(root: Root):
+    results = []
+    task = _Pool.of(root).submit(sum, (1, 2)).then(results.append)
+    root.until(lambda: results)
+    assert results == [3]
+    task.then(results.append)  # Already done
+    assert results == [3, 3]
+
+
+def test_error(root: Root):
+    errors = []
+    _Pool.of(root).submit(int, "nan").then(errors.append, lambda err: errors.append(type(err)))
+    _Pool.of(root).submit(int, "nan").then(errors.append)
+    root.until(lambda: errors and root.errors)
+    assert errors == [ValueError]
+    assert isinstance(root.errors[0], ValueError)
+
+
+def test_batch(root: Root):
+    pool = _Pool.of(root)
+    calls = []
+    for i in range(pool.BATCH * 2 + 1):
+        pool.post(calls.append, i)
+    root.step()
+    assert len(calls) == pool.BATCH
+    root.step()
+    root.step()
+    assert calls == list(range(pool.BATCH * 2 + 1))
+    assert not root.step(0)
+
+
+def test_cancel_on_destroy(root: Root):
+    started, release = Event(), Event()
+    results = []
+    widget = Widget(root)
+    task = widget.submit(lambda: (started.set(), release.wait(TIMEOUT))).then(results.append)
+    assert started.wait(TIMEOUT)
+    widget.destroy()
+    release.set()
+    root.until(lambda: not widget._BaseWidget__futures)
+    assert task.cancelled and results == []
+
+
+def test_outside_mainloop(root: Root):
+    root.looping = False
+    results = []
+    pool = _Pool.of(root)
+    pool.submit(sum, (1, 2)).then(results.append)
+    pool.submit(sum, (3, 4)).then(results.append)
+    deadline = monotonic() + TIMEOUT
+    while len(results) < 2 and monotonic() < deadline:
+        pool.flush()  # As App.update
+    root.looping = True
+    pool.submit(sum, (5, 6)).then(results.append)
+    root.until(lambda: len(results) == 3)
+    assert sorted(results) == [3, 7, 11]
+
+
+def test_shutdown(root: Root):
+    _Pool.of(root).shutdown()
+    with pytest.raises(RuntimeError):
+        _Pool.of(root).submit(sum, ())
@@ -0,0 +1,143 @@
+# coding: utf-8
+"""Tests of the events scheduler, on a fake root with a manual clock."""
+
+from itertools import count
+
+import pytest
+
+from tkyml import widgets
+from tkyml.widgets import _Scheduler
+
+
+class Root:
+
+    """Fake root, keeping timers until run.
+    """
+
+    def __init__(self) -> None:
+        self.ms = 0
+        self.timers: dict[str, tuple[int, callable]] = {}
+        self.errors: list[BaseException] = []
+        self.__ids = count()
+
+    def _root(self) -> "Root":
+        return self
+
+    def monotonic(self) -> float:
+        return self.ms / 1000
+
+    def after(self, delay: int, fn: callable) -> str:
+        id = f"after#{next(self.__ids)}"
+        self.timers[id] = (self.ms + delay, fn)
+        return id
+
+    def after_idle(self, fn: callable) -> str:
+        return self.after(0, fn)
+
+    def after_cancel(self, id: str):
+        del self.timers[id]
+
+    def report_callback_exception(self, type: type, err: BaseException, traceback: any):
+        self.errors.append(err)
+
+    def advance(self, delay: int):
+        """Move the clock by some ms, running the timers due."""
+        self.ms += delay
+        for id, (due, fn) in sorted(self.timers.items(), key=lambda item: item[1][0]):
+            if due <= self.ms and id in self.timers:
+                del self.timers[id]
+                fn()
+
+
+@pytest.fixture
+def root(monkeypatch: pytest.MonkeyPatch) -> Root:
+    root = Root()
+    monkeypatch.setattr(widgets, "monotonic", root.monotonic)
+    return root
+
+
+def bind(root: Root, throttle: int = 0, debounce: int = 0, path: str = ".w") -> tuple[callable, list]:
+    received = []
+    return _Scheduler.of(root).binding(path, "<Motion>", received.append, throttle, debounce), received
+
+
+def test_of(root: Root):
+    assert _Scheduler.of(root) is _Scheduler.of(root)
+
+
+def test_coalesce(root: Root):
+    binding, received = bind(root)
+    for ev in range(3):
+        binding(ev)
+    assert received == []
+    root.advance(0)
+    assert received == [2]
+
+
+def test_throttle(root: Root):
+    binding, received = bind(root, throttle=100)
+    binding(0)
+    assert received == [0]
+    root.advance(10)
+    binding(1)
+    binding(2)
+    root.advance(50)
+    assert received == [0]
+    root.advance(41)  # Delays are rounded up to the ms
+    assert received == [0, 2]
+
+
+def test_debounce(root: Root):
+    binding, received = bind(root, debounce=100)
+    for ev in range(3):
+        binding(ev)
+        root.advance(60)
+    assert received == []
+    root.advance(41)
+    assert received == [2]
+
+
+def test_single_timer(root: Root):
+    for delay in (300, 100, 200):
+        bind(root, debounce=delay)[0](delay)
+    assert len(root.timers) == 1
+    root.advance(300)
+    assert not root.timers
+
+
+def test_stats(root: Root):
+    binding, _ = bind(root, throttle=100)
+    for ev in range(3):
+        binding(ev)
+    root.advance(100)
+    assert _Scheduler.of(root).stats() == {(".w", "<Motion>"): (3, 2)}
+
+
+def test_drop(root: Root):
+    binding, received = bind(root, debounce=100)
+    other, kept = bind(root, debounce=100, path=".v")
+    binding(0)
+    other(1)
+    scheduler = _Scheduler.of(root)
+    scheduler.drop(".w")
+    root.advance(100)
+    assert received == [] and kept == [1]
+    assert not scheduler.pending(binding)
+    assert list(scheduler.stats()) == [(".v", "<Motion>")]
+
+
+def test_failing_handler(root: Root):
+    def fail(ev: int):
+        raise ValueError(ev)
+
+    failing = _Scheduler.of(root).binding(".a", "<Motion>", fail, 0, 100)
+    binding, received = bind(root, debounce=100, path=".b")
+    failing(0)
+    binding(1)
+    root.advance(101)
+    assert received == [1]
+    assert [err.args for err in root.errors] == [(0,)]
+    failing(2)
+    binding(3)
+    root.advance(101)
+    assert received == [1, 3]